@@ -22,8 +22,13 @@ class TweetAnalyzer(ABC):
         pass
 
     @abstractmethod
-    def q1_memory(self, file_path: str) -> List[Tuple[datetime.date, str]]:
-        """Versión optimizada en memoria de q1_time."""
+    def q1_memory(self, file_path: str, workers: int = 1) -> List[Tuple[datetime.date, str]]:
+        """Versión optimizada en memoria de q1_time.
+        
+        Args:
+            file_path: Ruta al archivo JSON que contiene los tweets
+            workers: Cantidad de procesos para repartir el archivo (1 = streaming secuencial)
+        """
         pass
 
     @abstractmethod
@@ -66,8 +71,8 @@ class TweetAnalyzerImpl(TweetAnalyzer):
     def q1_time(self, file_path: str) -> List[Tuple[datetime.date, str]]:
         return q1_time(file_path)
         
-    def q1_memory(self, file_path: str) -> List[Tuple[datetime.date, str]]:
-        return q1_memory(file_path)
+    def q1_memory(self, file_path: str, workers: int = 1) -> List[Tuple[datetime.date, str]]:
+        return q1_memory(file_path, workers=workers)
         
     def q2_time(self, file_path: str) -> List[Tuple[str, int]]:
         return q2_time(file_path)
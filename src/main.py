@@ -7,6 +7,7 @@ from zipfile import BadZipFile
 
 from src.interface.tweet_analyzer import TweetAnalyzerImpl
 from src.utils.exceptions import TweetRepositoryError
+from src.utils.files import extract_json
 
 # Configurar logging
 logging.basicConfig(
@@ -15,34 +16,42 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-QueryFunction = Callable[[str], List[Tuple[Any, Any]]]
+QueryFunction = Callable[..., List[Tuple[Any, Any]]]
+
+_analyzer = TweetAnalyzerImpl()
 
 def get_analyzer() -> TweetAnalyzerImpl:
-    """Obtiene una instancia del analizador de tweets."""
-    return TweetAnalyzerImpl()
+    """Obtiene la instancia compartida del analizador de tweets."""
+    return _analyzer
 
+# Métodos ligados de la instancia compartida: evita crear un analizador y
+# un frame extra (lambda) por cada ejecución
 AVAILABLE_QUERIES: Dict[str, Dict[str, QueryFunction]] = {
     'q1': {
-        'time': lambda x: get_analyzer().q1_time(x),
-        'memory': lambda x: get_analyzer().q1_memory(x)
+        'time': _analyzer.q1_time,
+        'memory': _analyzer.q1_memory
     },
     'q2': {
-        'time': lambda x: get_analyzer().q2_time(x),
-        'memory': lambda x: get_analyzer().q2_memory(x)
+        'time': _analyzer.q2_time,
+        'memory': _analyzer.q2_memory
     },
     'q3': {
-        'time': lambda x: get_analyzer().q3_time(x),
-        'memory': lambda x: get_analyzer().q3_memory(x)
+        'time': _analyzer.q3_time,
+        'memory': _analyzer.q3_memory
     }
 }
 
-def measure_execution_time(func: QueryFunction, file_path: str) -> Tuple[List[Tuple[Any, Any]], float]:
+# Queries que aceptan repartir el procesamiento entre varios procesos (--workers)
+PARALLEL_QUERIES = {('q1', 'memory')}
+
+def measure_execution_time(func: QueryFunction, file_path: str, **options: Any) -> Tuple[List[Tuple[Any, Any]], float]:
     """
     Mide el tiempo de ejecución de una función.
     
     Args:
         func: Función a medir
         file_path: Ruta al archivo de datos
+        **options: Argumentos adicionales para la función
         
     Returns:
         Tupla con los resultados y el tiempo de ejecución
@@ -53,7 +62,7 @@ def measure_execution_time(func: QueryFunction, file_path: str) -> Tuple[List[Tu
     try:
         logger.info("Iniciando ejecución de %s", func.__name__)
         start_time = time.time()
-        result = func(file_path)
+        result = func(file_path, **options)
         execution_time = time.time() - start_time
         logger.info("Ejecución completada en %s segundos", execution_time)
         return result, execution_time
@@ -95,7 +104,7 @@ def display_results(results: List[Tuple[Any, Any]], execution_time: float, query
         logger.error("Error mostrando resultados: %s", error)
         print("Error al mostrar los resultados. Consulte los logs para más detalles.")
 
-def execute_query(query: str, optimization: str, file_path: str) -> None:
+def execute_query(query: str, optimization: str, file_path: str, workers: int = 1) -> None:
     """
     Ejecuta una consulta específica con la optimización indicada.
     
@@ -103,6 +112,7 @@ def execute_query(query: str, optimization: str, file_path: str) -> None:
         query: Identificador de la consulta (q1, q2, q3)
         optimization: Tipo de optimización (time, memory)
         file_path: Ruta al archivo de datos
+        workers: Cantidad de procesos para las queries que lo soportan
         
     Raises:
         ValueError: Si la query u optimización no están disponibles
@@ -118,8 +128,15 @@ def execute_query(query: str, optimization: str, file_path: str) -> None:
     logger.info("Ejecutando %s (Optimizado para %s)", query, optimization)
     query_func = AVAILABLE_QUERIES[query][optimization]
     
+    options = {}
+    if workers > 1:
+        if (query, optimization) in PARALLEL_QUERIES:
+            options['workers'] = workers
+        else:
+            logger.warning("--workers no aplica a %s (%s); se ignora", query, optimization)
+    
     try:
-        results, exec_time = measure_execution_time(query_func, file_path)
+        results, exec_time = measure_execution_time(query_func, file_path, **options)
         display_results(results, exec_time, query)
     except FileNotFoundError:
         logger.error("No se encontró el archivo: %s", file_path)
@@ -159,9 +176,23 @@ def main() -> None:
             default="data/tweets.json.zip",
             help='Ruta al archivo de tweets'
         )
+        parser.add_argument(
+            '--extract',
+            action='store_true',
+            help='Descomprime el ZIP una sola vez junto al original y reutiliza la copia'
+        )
+        parser.add_argument(
+            '--workers',
+            type=int,
+            default=1,
+            help='Cantidad de procesos para q1 memory (1 = streaming secuencial)'
+        )
         
         args = parser.parse_args()
-        execute_query(args.query, args.optimization, args.file)
+        if args.workers < 1:
+            parser.error('--workers debe ser mayor o igual a 1')
+        file_path = extract_json(args.file) if args.extract else args.file
+        execute_query(args.query, args.optimization, file_path, args.workers)
     except KeyboardInterrupt:
         logger.info("Ejecución interrumpida por el usuario")
         print("\nEjecución interrumpida por el usuario")
@@ -1,117 +1,309 @@
-from typing import List, Tuple, Iterator
-from datetime import datetime
-import json
+from typing import Dict, List, Tuple, Iterator, Optional
+from datetime import datetime, date as Date
 import logging
-from zipfile import ZipFile
-from collections import Counter
-from memory_profiler import profile
+import sys
+from collections import Counter, deque
+from concurrent.futures import ProcessPoolExecutor
+from heapq import nlargest
+import orjson
+from src.utils.profiling import profile
 from src.utils.exceptions import TweetRepositoryError
+from src.utils.files import is_zip_path, iter_line_blocks, open_json_stream, read_range, split_line_ranges
+from src.utils.json_fields import find_json_string_bounds
 
 logger = logging.getLogger(__name__)
 
-def process_tweets(file_path: str) -> Iterator[tuple]:
+# Cantidad de tweets que se cuentan por lote en modo secuencial
+BATCH_SIZE = 10000
+
+# Tamaño de los bloques que se reparten entre procesos en modo paralelo (4 MB)
+BLOCK_SIZE = 1 << 22
+
+# Errores esperables al interpretar una línea que no es un tweet válido
+INVALID_LINE_ERRORS = (orjson.JSONDecodeError, KeyError, TypeError, ValueError)
+
+# Marcadores de los únicos campos que necesita q1. En el dump, `date` y `user`
+# aparecen antes que los objetos anidados (quotedTweet, mentionedUsers, ...),
+# por lo que la primera ocurrencia corresponde al tweet principal.
+DATE_MARKER = b'"date":'
+USER_MARKER = b'"user":'
+USERNAME_MARKER = b'"username":'
+
+def extract_fields(line: bytes, usernames: Dict[bytes, str]) -> Optional[Tuple[bytes, str]]:
+    """
+    Extrae (clave de fecha, username) de una línea mediante búsquedas de bytes.
+    
+    Args:
+        line: Línea JSON del tweet
+        usernames: Pool de usernames ya decodificados, indexado por el valor
+            JSON crudo; garantiza una única instancia de str por usuario y
+            evita decodificar repetidos
+    
+    Returns:
+        Tupla (b'YYYY-MM-DD', username) o None si algún marcador no se
+        encuentra o el username no está dentro del objeto `user`
+    """
+    date_bounds = find_json_string_bounds(line, DATE_MARKER)
+    if date_bounds is None:
+        return None
+    user_position = line.find(USER_MARKER)
+    if user_position < 0:
+        return None
+    username_bounds = find_json_string_bounds(line, USERNAME_MARKER, user_position)
+    # El username debe pertenecer al objeto `user` (antes de su primer '}');
+    # si no, podría ser el de un objeto anidado posterior y se recurre a orjson
+    if username_bounds is None or username_bounds[0] > line.find(b'}', user_position):
+        return None
+    raw_username = line[username_bounds[0]:username_bounds[1]]
+    username = usernames.get(raw_username)
+    if username is None:
+        # Sin escapes basta con quitar las comillas; con escapes se decodifica el valor
+        if b'\\' in raw_username:
+            username = orjson.loads(raw_username)
+        else:
+            username = raw_username[1:-1].decode('utf-8')
+        usernames[raw_username] = username
+    return line[date_bounds[0] + 1:date_bounds[1] - 1][:10], username
+
+def parse_line(line: bytes, usernames: Dict[bytes, str], dates: Dict[bytes, Date]) -> Tuple[bytes, str]:
+    """
+    Obtiene (clave de fecha, username) de una línea del archivo.
+    
+    Args:
+        line: Línea JSON del tweet
+        usernames: Pool de usernames compartido durante la lectura
+        dates: Pool de claves de fecha ya validadas durante la lectura; cada
+            clave distinta se parsea una sola vez
+    
+    Raises:
+        ValueError, KeyError, TypeError: Si la línea no es un tweet válido
+    """
+    # Camino rápido: búsqueda de bytes, sin construir el dict del tweet
+    fields = extract_fields(line, usernames)
+    if fields is None:
+        # Fallback: parseo completo para líneas con otro formato.
+        # Solo interesa el prefijo YYYY-MM-DD, que se usa como clave
+        tweet = orjson.loads(line)
+        fields = tweet['date'][:10].encode('ascii'), sys.intern(tweet['user']['username'])
+    
+    # Se valida la fecha aquí, dentro del manejo por línea, para que una fecha
+    # inválida descarte solo su línea y no falle al armar el resultado final
+    date_key = fields[0]
+    if date_key not in dates:
+        dates[date_key] = parse_date_key(date_key)
+    return fields
+
+def process_tweets(file_path: str, batch_size: int = BATCH_SIZE) -> Iterator[List[Tuple[bytes, str]]]:
     """
     Lee tweets del archivo ZIP línea por línea para minimizar uso de memoria.
+    Los resultados se entregan por lotes para no reanudar el generador por
+    cada tweet y permitir el conteo en bloque con Counter.update.
+    
+    Args:
+        file_path: Ruta al archivo ZIP con los tweets (o al JSONL ya extraído)
+        batch_size: Cantidad de tweets por lote
+        
+    Yields:
+        Listas de tuplas (clave de fecha b'YYYY-MM-DD', username)
+    """
+    usernames: Dict[bytes, str] = {}
+    dates: Dict[bytes, Date] = {}
+    # Alias locales: evitan LOAD_GLOBAL por cada línea del loop
+    parse = parse_line
+    invalid_line_errors = INVALID_LINE_ERRORS
+    batch = []
+    append = batch.append
+    try:
+        with open_json_stream(file_path) as json_file:
+            for line_number, line in enumerate(json_file, 1):
+                try:
+                    append(parse(line, usernames, dates))
+                except invalid_line_errors as e:
+                    logger.warning("Error en línea %s: %s", line_number, str(e))
+                    continue
+                
+                if len(batch) >= batch_size:
+                    yield batch
+                    batch = []
+                    append = batch.append
+            
+            if batch:
+                yield batch
+
+    except Exception as error:
+        logger.error("Error procesando archivo: %s", error)
+        raise TweetRepositoryError(f"Error al procesar archivo: {error}")
+
+def read_blocks(file_path: str, block_size: int = BLOCK_SIZE) -> Iterator[bytes]:
+    """
+    Lee el archivo descomprimido en bloques alineados a fin de línea.
     
     Args:
         file_path: Ruta al archivo ZIP con los tweets
+        block_size: Tamaño aproximado de cada bloque en bytes
         
     Yields:
-        Tupla de (fecha, username)
+        Bloques de bytes que contienen solo líneas completas
     """
     try:
-        with ZipFile(file_path) as zip_file:
-            json_filename = zip_file.namelist()[0]
-            with zip_file.open(json_filename) as json_file:
-                for line_number, line in enumerate(json_file, 1):
-                    try:
-                        tweet = json.loads(line)
-                        date = datetime.fromisoformat(
-                            tweet['date'].replace('Z', '+00:00')
-                        ).date()
-                        username = tweet['user']['username']
-                        yield (date, username)
-                    except (json.JSONDecodeError, KeyError, ValueError) as e:
-                        logger.warning("Error en línea %s: %s", line_number, str(e))
-                        continue
+        yield from iter_line_blocks(file_path, block_size)
 
     except Exception as error:
         logger.error("Error procesando archivo: %s", error)
         raise TweetRepositoryError(f"Error al procesar archivo: {error}")
 
+def by_count_desc(item: Tuple[object, int]) -> Tuple[int, object]:
+    """Clave de orden: mayor conteo primero y, ante empate, menor clave."""
+    return -item[1], item[0]
+
+def parse_date_key(date_key: bytes) -> Date:
+    """
+    Convierte una clave 'YYYY-MM-DD' en datetime.date sin parsear el timestamp completo.
+    
+    Raises:
+        ValueError: Si la clave no es una fecha válida
+    """
+    if len(date_key) != 10 or date_key[4:5] != b'-' or date_key[7:8] != b'-':
+        raise ValueError(f"Fecha inválida: {date_key!r}")
+    return Date(int(date_key[:4]), int(date_key[5:7]), int(date_key[8:10]))
+
 class DateTracker:
     """
     Clase para rastrear estadísticas por fecha de manera eficiente en memoria.
+
+    Durante la lectura se mantiene un único Counter plano con clave
+    (fecha, username): una sola operación de hash por tweet en lugar de una
+    por cada estructura anidada. Los totales por fecha y el usuario más activo
+    de cada fecha se obtienen en una única pasada al final. El conteo no
+    depende del orden de los tweets en el archivo y permite combinar
+    resultados parciales.
+
+    No se usa un sketch acotado (Space-Saving / Misra-Gries) por fecha: con
+    capacidad fija el usuario más activo deja de ser exacto cuando su conteo
+    no supera total_fecha / capacidad, y tampoco se pueden descartar fechas
+    fuera del top parcial porque una fecha puede volver a entrar más adelante.
     """
-    def __init__(self, max_dates: int = 20):
-        self.date_counts = Counter()
-        self.current_user_counts = Counter()
-        self.top_users = {}
-        self.current_date = None
-        self.max_dates = max_dates
-        self._prune_threshold = max_dates * 2
-
-    def add_tweet(self, date: datetime.date, username: str) -> None:
-        """Agrega un tweet al tracking."""
-        self.date_counts[date] += 1
-
-        if date != self.current_date:
-            if self.current_date and self.current_user_counts:
-                # Guardar el usuario más activo de la fecha anterior
-                top_user = self.current_user_counts.most_common(1)[0][0]
-                if self.date_counts[self.current_date] >= self._get_min_count():
-                    self.top_users[self.current_date] = top_user
-            self.current_user_counts.clear()
-            self.current_date = date
-
-        self.current_user_counts[username] += 1
-        
-        # Podar datos cuando sea necesario
-        if len(self.date_counts) > self._prune_threshold:
-            self._prune_data()
-
-    def _get_min_count(self) -> int:
-        """Obtiene el conteo mínimo entre las top fechas."""
-        if len(self.date_counts) < self.max_dates:
-            return 0
-        return min(count for _, count in self.date_counts.most_common(self.max_dates))
-
-    def _prune_data(self) -> None:
-        """Elimina fechas que no pueden estar en el top final."""
-        min_count = self._get_min_count()
-        self.date_counts = Counter({
-            date: count for date, count in self.date_counts.items()
-            if count >= min_count
-        })
-        self.top_users = {
-            date: user for date, user in self.top_users.items()
-            if self.date_counts[date] >= min_count
-        }
+    def __init__(self):
+        self.pair_counts = Counter()
+
+    def add_batch(self, pairs: List[Tuple[bytes, str]]) -> None:
+        """Agrega un lote de tweets (fecha, username) en una sola llamada a Counter.update."""
+        self.pair_counts.update(pairs)
+
+    def merge(self, pair_counts: Counter) -> None:
+        """Combina los conteos parciales de otro tracker."""
+        self.pair_counts.update(pair_counts)
 
     def get_top_results(self, n: int = 10) -> List[Tuple[datetime.date, str]]:
-        """Obtiene los resultados finales."""
-        # Procesar la última fecha si es necesario
-        if self.current_date and self.current_user_counts:
-            top_user = self.current_user_counts.most_common(1)[0][0]
-            if self.date_counts[self.current_date] >= self._get_min_count():
-                self.top_users[self.current_date] = top_user
-
-        # Obtener top fechas y sus usuarios
-        top_dates = self.date_counts.most_common(n)
-        return [
-            (date, self.top_users[date])
-            for date, _ in top_dates
-            if date in self.top_users
-        ]
+        """
+        Obtiene los resultados finales.
+        
+        Selección O(K log n) con heap. Los empates se resuelven de forma explícita
+        (fecha más antigua, username alfabético) para que el resultado no dependa
+        del orden de inserción, que en modo paralelo varía entre ejecuciones.
+        """
+        date_totals = Counter()
+        date_best: Dict[bytes, Tuple[str, int]] = {}
+        
+        # Una pasada: totales por fecha y usuario más activo por fecha
+        for (date, username), count in self.pair_counts.items():
+            date_totals[date] += count
+            best = date_best.get(date)
+            if best is None or count > best[1] or (count == best[1] and username < best[0]):
+                date_best[date] = (username, count)
+        
+        # Umbral del top-n con nlargest sobre enteros (sin key en Python); solo
+        # los sobrevivientes, incluidos empates en el umbral, se ordenan con clave
+        top_counts = nlargest(n, date_totals.values())
+        if not top_counts:
+            return []
+        threshold = top_counts[-1]
+        survivors = [item for item in date_totals.items() if item[1] >= threshold]
+        top_dates = sorted(survivors, key=by_count_desc)[:n]
+        return [(parse_date_key(date), date_best[date][0]) for date, _ in top_dates]
+
+def process_block(block: bytes) -> Tuple[Counter, int]:
+    """
+    Procesa un bloque de líneas en un proceso worker.
+    
+    Returns:
+        Tupla (conteo por (fecha, username), tweets procesados)
+    """
+    tracker = DateTracker()
+    usernames: Dict[bytes, str] = {}
+    dates: Dict[bytes, Date] = {}
+    pairs = []
+    append = pairs.append
+    parse = parse_line
+    invalid_line_errors = INVALID_LINE_ERRORS
+    errors = 0
+    for line in block.splitlines():
+        try:
+            append(parse(line, usernames, dates))
+        except invalid_line_errors:
+            errors += 1
+    if errors:
+        logger.warning("Bloque con %d líneas inválidas", errors)
+    tracker.add_batch(pairs)
+    return tracker.pair_counts, len(pairs)
+
+def process_range(file_path: str, start: int, end: int) -> Tuple[Counter, int]:
+    """
+    Procesa un rango de bytes de un JSONL extraído en un proceso worker.
+    El worker lee el rango directamente del archivo (mmap), de modo que el
+    proceso principal solo envía offsets y no bloques de datos.
+    """
+    return process_block(read_range(file_path, start, end))
+
+def process_parallel(file_path: str, tracker: DateTracker, workers: int) -> int:
+    """
+    Reparte los bloques del archivo entre procesos y combina los conteos parciales.
+    Se limita la cantidad de bloques en vuelo para acotar el uso de memoria.
+    
+    Con un ZIP, el proceso principal descomprime y envía cada bloque; con un
+    JSONL ya extraído, solo envía rangos de bytes y cada worker lee el suyo.
+    
+    Returns:
+        Cantidad de tweets procesados
+    """
+    tweets_processed = 0
+    max_pending = workers * 2
+    pending = deque()
+    
+    def collect(future) -> None:
+        nonlocal tweets_processed
+        pair_counts, block_tweets = future.result()
+        tracker.merge(pair_counts)
+        tweets_processed += block_tweets
+        logger.info("Procesados %s tweets", tweets_processed)
+    
+    if is_zip_path(file_path):
+        tasks = ((process_block, block) for block in read_blocks(file_path))
+    else:
+        tasks = (
+            (process_range, file_path, start, end)
+            for start, end in split_line_ranges(file_path, BLOCK_SIZE)
+        )
+    
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for task, *args in tasks:
+            pending.append(executor.submit(task, *args))
+            if len(pending) >= max_pending:
+                collect(pending.popleft())
+        while pending:
+            collect(pending.popleft())
+    
+    return tweets_processed
 
 @profile
-def q1_memory(file_path: str) -> List[Tuple[datetime.date, str]]:
+def q1_memory(file_path: str, workers: int = 1) -> List[Tuple[datetime.date, str]]:
     """
     Encuentra las 10 fechas con más tweets y el usuario con más publicaciones por fecha.
     Implementación optimizada para memoria usando streaming y estructuras eficientes.
     
     Args:
         file_path: Ruta al archivo ZIP con los tweets
+        workers: Cantidad de procesos; con 1 se procesa en streaming secuencial
         
     Returns:
         Lista de tuplas (fecha, username) con las 10 fechas con más tweets
@@ -120,14 +312,19 @@ def q1_memory(file_path: str) -> List[Tuple[datetime.date, str]]:
         tracker = DateTracker()
         tweets_processed = 0
         
+        if workers > 1:
+            logger.info("Iniciando procesamiento de tweets con %d procesos", workers)
+            tweets_processed = process_parallel(file_path, tracker, workers)
+            logger.info("Procesamiento completado: %d tweets analizados", tweets_processed)
+            return tracker.get_top_results()
+        
         logger.info("Iniciando procesamiento de tweets")
         
-        for tweet_date, username in process_tweets(file_path):
-            tracker.add_tweet(tweet_date, username)
-            tweets_processed += 1
-            
-            if tweets_processed % 10000 == 0:
-                logger.info("Procesados %s tweets", tweets_processed)
+        # Conteo por lotes: Counter.update recorre cada lote en C
+        for batch in process_tweets(file_path):
+            tracker.add_batch(batch)
+            tweets_processed += len(batch)
+            logger.info("Procesados %s tweets", tweets_processed)
 
         logger.info("Procesamiento completado: %d tweets analizados", tweets_processed)
         return tracker.get_top_results()
@@ -2,11 +2,16 @@ from typing import List, Tuple
 from datetime import datetime
 import logging
 import pandas as pd
-from memory_profiler import profile
+from src.utils.profiling import profile
 from src.utils.exceptions import TweetRepositoryError
 
 logger = logging.getLogger(__name__)
 
+# Cantidad de tweets leídos por chunk; acota el pico de memoria de la lectura
+CHUNK_SIZE = 20000
+
+REQUIRED_COLUMNS = ['date', 'user']
+
 @profile
 def q1_time(file_path: str) -> List[Tuple[datetime.date, str]]:
     """
@@ -25,51 +30,66 @@ def q1_time(file_path: str) -> List[Tuple[datetime.date, str]]:
     """
     try:
         logger.info("Iniciando lectura del archivo de tweets")
-        # Leer directamente a DataFrame sin pasar por objetos Pydantic
-        df = pd.read_json(file_path, lines=True)
-        logger.info("Leídos %s tweets", len(df))
+        # Leer por chunks y agregar conteos parciales para no cargar todo el archivo
+        partial_counts = []
+        tweets_read = 0
         
         try:
-            # Validar columnas requeridas
-            required_columns = ['date', 'user']
-            missing_columns = [col for col in required_columns if col not in df.columns]
-            if missing_columns:
-                raise TweetRepositoryError(f"Columnas faltantes: {', '.join(missing_columns)}")
-            
-            logger.info("Procesando fechas y usuarios")
-            try:
-                # Convertir date a fecha y extraer username en una sola operación
-                df['date'] = pd.to_datetime(df['date']).dt.date
-                df['username'] = df['user'].apply(lambda x: x.get('username', ''))
-                
-                # Agregar contador por fecha y usuario en una operación
-                logger.info("Calculando conteos por fecha y usuario")
-                grouped = df.groupby(['date', 'username']).size().reset_index(name='count')
-                
-                # Encontrar las top 10 fechas
-                logger.info("Identificando las 10 fechas con más tweets")
-                date_counts = grouped.groupby('date')['count'].sum()
-                top_dates = date_counts.nlargest(10)
-                
-                if top_dates.empty:
-                    logger.warning("No se encontraron fechas con tweets")
-                    return []
+            with pd.read_json(file_path, lines=True, chunksize=CHUNK_SIZE) as reader:
+                for chunk in reader:
+                    # Validar columnas requeridas
+                    missing_columns = [col for col in REQUIRED_COLUMNS if col not in chunk.columns]
+                    if missing_columns:
+                        raise TweetRepositoryError(f"Columnas faltantes: {', '.join(missing_columns)}")
                     
-                logger.info("Encontradas %s fechas top", len(top_dates))
-                
-                # Filtrar solo las fechas top y encontrar usuario top por fecha
-                filtered = grouped[grouped['date'].isin(top_dates.index)]
-                result = (filtered.sort_values(['date', 'count'], ascending=[True, False])
-                         .groupby('date').first()
-                         .reset_index()[['date', 'username']])
-                
-                logger.info("Análisis completado exitosamente")
-                return list(zip(result['date'], result['username']))
+                    try:
+                        # Convertir date a fecha y extraer username, descartando el resto de columnas.
+                        # El username se toma recorriendo el arreglo de dicts directamente: evita
+                        # el callback por fila de Series.apply y el frame completo de json_normalize
+                        dates = pd.to_datetime(chunk['date']).dt.date
+                        usernames = [user.get('username', '') for user in chunk['user'].values]
+                    except (AttributeError, KeyError) as error:
+                        logger.error("Error procesando datos: %s", error)
+                        raise TweetRepositoryError(f"Error en el procesamiento de datos: {error}")
+                    
+                    # Conteo parcial por fecha y usuario del chunk
+                    partial_counts.append(
+                        pd.DataFrame({'date': dates, 'username': usernames})
+                        .groupby(['date', 'username'], sort=False).size()
+                    )
+                    tweets_read += len(chunk)
+                    logger.info("Leídos %s tweets", tweets_read)
+            
+            if not partial_counts:
+                logger.warning("No se encontraron fechas con tweets")
+                return []
+            
+            # Combinar los conteos parciales en una Serie indexada por (fecha, usuario)
+            logger.info("Calculando conteos por fecha y usuario")
+            pair_counts = (pd.concat(partial_counts)
+                           .groupby(level=['date', 'username'], sort=False).sum())
+            
+            # Encontrar las top 10 fechas sumando sobre el mismo índice
+            logger.info("Identificando las 10 fechas con más tweets")
+            date_counts = pair_counts.groupby(level='date').sum()
+            top_dates = date_counts.nlargest(10)
+            
+            if top_dates.empty:
+                logger.warning("No se encontraron fechas con tweets")
+                return []
                 
-            except (AttributeError, KeyError) as error:
-                logger.error("Error procesando datos: %s", error)
-                raise TweetRepositoryError(f"Error en el procesamiento de datos: {error}")
+            logger.info("Encontradas %s fechas top", len(top_dates))
+            
+            # Usuario top por fecha: idxmax por grupo entrega directamente la
+            # tupla (fecha, usuario), sin reset_index ni ordenar el frame
+            filtered = pair_counts[pair_counts.index.get_level_values('date').isin(top_dates.index)]
+            result = filtered.groupby(level='date').idxmax()
+            
+            logger.info("Análisis completado exitosamente")
+            return list(result)
                 
+        except TweetRepositoryError:
+            raise
         except pd.errors.EmptyDataError:
             logger.error("No se encontraron datos válidos")
             return []
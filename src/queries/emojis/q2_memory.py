@@ -1,13 +1,17 @@
-from typing import List, Tuple, Iterator, Dict
-import json
+from typing import List, Tuple, Iterator, Iterable, Dict
+from re import Match
 import logging
-from zipfile import ZipFile, BadZipFile
-import emoji
-from memory_profiler import profile
+from zipfile import BadZipFile
+import orjson
+from src.utils.profiling import profile
 from heapq import nlargest
 from collections import Counter
+from src.utils.emojis import EMOJI_PATTERN
 from src.utils.exceptions import TweetRepositoryError
+from src.utils.files import is_zip_path, open_json_stream
+from src.utils.json_fields import extract_content
 import mmap
+import os
 from contextlib import contextmanager
 
 logger = logging.getLogger(__name__)
@@ -22,12 +26,31 @@ def memory_mapped_file(filename: str):
         with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mm:
             yield mm
 
+@contextmanager
+def open_json_lines(file_path: str) -> Iterator[Iterable[bytes]]:
+    """
+    Entrega un iterable de líneas del archivo de tweets.
+    
+    Un JSONL ya extraído se recorre con memory mapping: las líneas se copian
+    desde las páginas del archivo sin buffers de lectura intermedios. Un ZIP
+    comprimido no admite mmap y se lee en streaming.
+    """
+    if is_zip_path(file_path):
+        with open_json_stream(file_path) as json_file:
+            yield json_file
+    elif os.path.getsize(file_path) == 0:
+        # mmap no admite archivos vacíos
+        yield iter(())
+    else:
+        with memory_mapped_file(file_path) as mm:
+            yield iter(mm.readline, b'')
+
 def batch_process_tweets(file_path: str, batch_size: int = 1000) -> Iterator[List[str]]:
     """
     Lee tweets en batches para optimizar el procesamiento manteniendo bajo uso de memoria.
     
     Args:
-        file_path: Ruta al archivo ZIP con los tweets
+        file_path: Ruta al archivo ZIP con los tweets (o al JSONL ya extraído)
         batch_size: Tamaño del batch para procesamiento
         
     Yields:
@@ -35,31 +58,23 @@ def batch_process_tweets(file_path: str, batch_size: int = 1000) -> Iterator[Lis
     """
     current_batch = []
     try:
-        with ZipFile(file_path) as zip_file:
-            try:
-                json_filename = zip_file.namelist()[0]
-            except IndexError:
-                logger.error("El archivo ZIP %s está vacío", file_path)
-                raise TweetRepositoryError("El archivo ZIP está vacío")
-                
-            with zip_file.open(json_filename) as json_file:
-                for line_number, line in enumerate(json_file, 1):
-                    try:
-                        tweet = json.loads(line)
-                        if content := tweet.get('content'):
-                            current_batch.append(content)
-                            
-                            if len(current_batch) >= batch_size:
-                                yield current_batch
-                                current_batch = []
-                                
-                    except (json.JSONDecodeError, KeyError) as error:
-                        logger.warning("Error en línea %d: %s", line_number, error)
-                        continue
+        with open_json_lines(file_path) as lines:
+            for line_number, line in enumerate(lines, 1):
+                try:
+                    if content := extract_content(line):
+                        current_batch.append(content)
                         
-                if current_batch:  # Procesar el último batch parcial
-                    yield current_batch
+                        if len(current_batch) >= batch_size:
+                            yield current_batch
+                            current_batch = []
+                            
+                except (orjson.JSONDecodeError, KeyError) as error:
+                    logger.warning("Error en línea %d: %s", line_number, error)
+                    continue
                     
+            if current_batch:  # Procesar el último batch parcial
+                yield current_batch
+                
     except FileNotFoundError:
         logger.error("Archivo no encontrado: %s", file_path)
         raise
@@ -70,12 +85,13 @@ def batch_process_tweets(file_path: str, batch_size: int = 1000) -> Iterator[Lis
         logger.error("Error inesperado al procesar archivo: %s", error)
         raise TweetRepositoryError(f"Error procesando archivo: {error}")
 
-def extract_emojis(text: str) -> List[str]:
+def extract_emojis(text: str) -> Iterator[str]:
     """
     Extrae emojis de un texto de manera eficiente.
-    Usa generadores para minimizar uso de memoria.
+    Usa el patrón precompilado y entrega los emojis como iterador, sin armar
+    una lista intermedia por tweet.
     """
-    return [c for c in text if c in emoji.EMOJI_DATA]
+    return map(Match.group, EMOJI_PATTERN.finditer(text))
 
 @profile
 def q2_memory(file_path: str) -> List[Tuple[str, int]]:
@@ -96,29 +112,27 @@ def q2_memory(file_path: str) -> List[Tuple[str, int]]:
         TweetRepositoryError: Para otros errores inesperados
     """
     try:
+        # El alfabeto de emojis es acotado (unos pocos miles), por lo que el
+        # contador completo cabe en memoria y no se poda: podarlo durante la
+        # lectura descartaría emojis que terminan siendo frecuentes
         emoji_counts = Counter()
         tweets_processed = 0
-        emojis_found = 0
         
         # Procesar tweets en batches para mejor eficiencia
         for batch in batch_process_tweets(file_path):
             try:
                 # Procesar cada batch de tweets
                 for text in batch:
-                    emojis = extract_emojis(text)
-                    emoji_counts.update(emojis)
-                    
-                    emojis_found += len(emojis)
-                    tweets_processed += 1
+                    emoji_counts.update(extract_emojis(text))
+                
+                tweets_processed += len(batch)
                 
                 if tweets_processed % 10000 == 0:
                     logger.info(
                         "Progreso: %d tweets procesados, %d emojis encontrados", 
                         tweets_processed, 
-                        emojis_found
+                        sum(emoji_counts.values())
                     )
-                    # Liberar memoria innecesaria periódicamente
-                    emoji_counts = Counter(dict(nlargest(100, emoji_counts.items(), key=lambda x: x[1])))
                     
             except Exception as error:
                 logger.error("Error procesando batch: %s", error)
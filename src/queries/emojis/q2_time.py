@@ -1,33 +1,30 @@
-from typing import List, Tuple
+from typing import Iterator, List, Tuple
 import pandas as pd
-import emoji
 import logging
 import multiprocessing
-from memory_profiler import profile
+from src.utils.profiling import profile
 from collections import Counter
-from concurrent.futures import ProcessPoolExecutor, as_completed
+from src.utils.emojis import EMOJI_PATTERN
 from src.utils.exceptions import TweetRepositoryError
 import numpy as np
 
 logger = logging.getLogger(__name__)
 
-def process_chunk(texts: List[str]) -> Counter:
+# Cantidad de tweets leídos por chunk; acota el pico de memoria de la lectura
+CHUNK_SIZE = 20000
+
+def process_chunk(text: str) -> Counter:
     """
     Procesa un chunk de textos para extraer y contar emojis.
     
     Args:
-        texts: Lista de textos a procesar
+        text: Textos del chunk unidos por '\\n'. El separador no es emoji, así
+            que un solo recorrido del regex da los mismos matches que tweet por tweet
         
     Returns:
         Counter con el conteo de emojis en el chunk
     """
-    chunk_counter = Counter()
-    for text in texts:
-        if not isinstance(text, str):
-            continue
-        emojis = [c for c in text if c in emoji.EMOJI_DATA]
-        chunk_counter.update(emojis)
-    return chunk_counter
+    return Counter(EMOJI_PATTERN.findall(text))
 
 @profile
 def q2_time(file_path: str) -> List[Tuple[str, int]]:
@@ -46,47 +43,42 @@ def q2_time(file_path: str) -> List[Tuple[str, int]]:
     """
     try:
         logger.info("Iniciando lectura del archivo de tweets")
-        df = pd.read_json(file_path, lines=True)
-        logger.info("Leídos %s tweets", len(df))
         
         try:
-            if 'content' not in df.columns:
-                raise TweetRepositoryError("El archivo no contiene la columna 'content'")
-            
             logger.info("Iniciando procesamiento paralelo de emojis")
             
             # Determinar número óptimo de cores
             n_cores = max(multiprocessing.cpu_count() - 1, 1)
             logger.info(f"Utilizando {n_cores} cores para procesamiento paralelo")
             
-            # Calcular tamaño óptimo de chunks basado en la cantidad de datos
-            total_rows = len(df)
-            chunk_size = max(total_rows // (n_cores * 2), 1000)  # Mínimo 1000 registros por chunk
-            n_chunks = (total_rows + chunk_size - 1) // chunk_size  # Redondeo hacia arriba
-            content_chunks = np.array_split(df['content'].values, n_chunks)
-            
             # Counter total para combinar resultados
             total_counter = Counter()
             tweets_procesados = 0
             
-            with ProcessPoolExecutor(max_workers=n_cores) as executor:
-                # Crear futures para cada chunk
-                future_to_chunk = {
-                    executor.submit(process_chunk, chunk.tolist()): i 
-                    for i, chunk in enumerate(content_chunks)
-                }
-                
-                # Procesar resultados a medida que completan
-                for future in as_completed(future_to_chunk):
-                    chunk_idx = future_to_chunk[future]
-                    try:
-                        chunk_counter = future.result()
-                        total_counter.update(chunk_counter)
-                        tweets_procesados += len(content_chunks[chunk_idx])
-                        logger.info("Procesado chunk %d, total tweets: %d", 
-                                  chunk_idx, tweets_procesados)
-                    except Exception as e:
-                        logger.error("Error en chunk %d: %s", chunk_idx, e)
+            def iter_parts(reader) -> Iterator[str]:
+                """
+                Lee por chunks y reparte cada uno entre los workers mientras se lee el siguiente.
+                Cada parte viaja como un único string: serializarlo es mucho más barato
+                que serializar una lista de miles de strings cortos.
+                """
+                nonlocal tweets_procesados
+                for chunk in reader:
+                    if 'content' not in chunk.columns:
+                        raise TweetRepositoryError("El archivo no contiene la columna 'content'")
+                    
+                    for part in np.array_split(chunk['content'].values, n_cores):
+                        yield '\n'.join(text for text in part if isinstance(text, str))
+                    tweets_procesados += len(chunk)
+                    logger.info("Leídos %s tweets", tweets_procesados)
+            
+            with multiprocessing.Pool(n_cores) as pool, \
+                    pd.read_json(file_path, lines=True, chunksize=CHUNK_SIZE) as reader:
+                # Combinar los Counters parciales a medida que completan; cada
+                # parte se libera en cuanto su worker la procesa
+                for chunk_idx, chunk_counter in enumerate(
+                        pool.imap_unordered(process_chunk, iter_parts(reader), chunksize=1)):
+                    total_counter.update(chunk_counter)
+                    logger.info("Procesado chunk %d", chunk_idx)
             
             if not total_counter:
                 logger.warning("No se encontraron emojis en ningún tweet")
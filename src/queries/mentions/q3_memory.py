@@ -1,71 +1,47 @@
 from typing import List, Tuple, Iterator
-import json
 import logging
-from zipfile import ZipFile, BadZipFile
-from memory_profiler import profile
+from zipfile import BadZipFile
+from src.utils.profiling import profile
 from collections import Counter
-import re
+import orjson
 from src.utils.exceptions import TweetRepositoryError
+from src.utils.files import open_json_stream
+from src.utils.json_fields import extract_raw_content
+from src.utils.mentions import iter_mentions
 
 logger = logging.getLogger(__name__)
 
 class MentionTracker:
     """
     Clase para rastrear y gestionar menciones de manera eficiente en memoria.
-    Mantiene un contador de menciones y realiza limpiezas periódicas.
+    Mantiene un contador exacto de menciones: no se poda durante la lectura,
+    porque un usuario poco mencionado al principio puede terminar en el top.
     """
-    def __init__(self, max_mentions: int = 100, cleanup_frequency: int = 10000):
+    def __init__(self):
         self.mention_counts = Counter()
-        self.max_mentions = max_mentions
-        self.cleanup_frequency = cleanup_frequency
         self.tweets_processed = 0
-        self.mentions_found = 0
-        self._pattern = re.compile(r'@([a-zA-Z0-9_]+)')
         
-    def process_tweet(self, text: str) -> None:
-        """
-        Procesa un tweet para extraer y contar menciones.
-        Realiza limpieza periódica según la frecuencia configurada.
-        """
-        if not isinstance(text, str):
+    def process_tweet(self, text: bytes) -> None:
+        """Procesa un tweet para extraer y contar menciones."""
+        if not isinstance(text, bytes):
             return
             
-        # Extraer menciones usando regex compilado
-        mentions = self._pattern.findall(text)
-        
-        # Actualizar contadores
-        self.mention_counts.update(mentions)
-        self.mentions_found += len(mentions)
+        # La mayoría de los tweets no tiene '@': la búsqueda en C evita invocar el regex
+        if b'@' in text:
+            # Las menciones son ASCII, por lo que se buscan sobre los bytes del texto
+            # sin decodificarlo ni armar una lista intermedia; los usernames se
+            # decodifican solo al entregar el top
+            self.mention_counts.update(iter_mentions(text))
         self.tweets_processed += 1
         
-        # Realizar limpieza periódica si es necesario
-        if self._should_cleanup():
-            self._cleanup_memory()
-            
-    def _should_cleanup(self) -> bool:
-        """Determina si es momento de realizar limpieza de memoria."""
-        return (self.tweets_processed % self.cleanup_frequency == 0 and 
-                len(self.mention_counts) > self.max_mentions)
-        
-    def _cleanup_memory(self) -> None:
-        """
-        Realiza limpieza de memoria manteniendo solo las menciones más frecuentes.
-        Registra la operación en el log.
-        """
-        before_size = len(self.mention_counts)
-        self.mention_counts = Counter(dict(
-            self.mention_counts.most_common(self.max_mentions)
-        ))
-        after_size = len(self.mention_counts)
-        
-        logger.info(
-            "Limpieza de memoria - Menciones: %d → %d | Tweets: %d | Total menciones: %d",
-            before_size, after_size, self.tweets_processed, self.mentions_found
-        )
+    @property
+    def mentions_found(self) -> int:
+        """Total de menciones contadas."""
+        return sum(self.mention_counts.values())
         
     def get_top_mentions(self, n: int = 10) -> List[Tuple[str, int]]:
         """Retorna las n menciones más frecuentes."""
-        return self.mention_counts.most_common(n)
+        return [(mention.decode(), count) for mention, count in self.mention_counts.most_common(n)]
         
     @property
     def stats(self) -> dict:
@@ -76,25 +52,20 @@ class MentionTracker:
             'unique_mentions': len(self.mention_counts)
         }
 
-def process_tweets(file_path: str) -> Iterator[str]:
-    """Lee tweets del archivo ZIP línea por línea."""
+def process_tweets(file_path: str) -> Iterator[bytes]:
+    """
+    Lee tweets del archivo ZIP (o del JSONL ya extraído) línea por línea.
+    Entrega el texto de cada tweet como bytes, sin decodificar el JSON.
+    """
     try:
-        with ZipFile(file_path) as zip_file:
-            try:
-                json_filename = zip_file.namelist()[0]
-            except IndexError:
-                logger.error("El archivo ZIP %s está vacío", file_path)
-                raise TweetRepositoryError("El archivo ZIP está vacío")
-                
-            with zip_file.open(json_filename) as json_file:
-                for line_number, line in enumerate(json_file, 1):
-                    try:
-                        tweet = json.loads(line)
-                        if content := tweet.get('content'):
-                            yield content
-                    except (json.JSONDecodeError, Exception) as error:
-                        logger.warning("Error en línea %d: %s", line_number, error)
-                        continue
+        with open_json_stream(file_path) as json_file:
+            for line_number, line in enumerate(json_file, 1):
+                try:
+                    if content := extract_raw_content(line):
+                        yield content
+                except (orjson.JSONDecodeError, Exception) as error:
+                    logger.warning("Error en línea %d: %s", line_number, error)
+                    continue
 
     except (FileNotFoundError, BadZipFile) as error:
         logger.error("Error con el archivo %s: %s", file_path, error)
@@ -1,25 +1,33 @@
-from typing import List, Tuple
+from typing import Iterator, List, Tuple
 import pandas as pd
 import numpy as np
 import logging
-from memory_profiler import profile
-import re
+from src.utils.profiling import profile
+from collections import Counter
 import multiprocessing
 from src.utils.exceptions import TweetRepositoryError
+from src.utils.mentions import iter_mentions
 
 logger = logging.getLogger(__name__)
 
-def extract_mentions_fast(text: str, pattern: re.Pattern) -> np.ndarray:
-    """Extracción rápida de menciones usando regex precompilado."""
-    return pattern.findall(text) if isinstance(text, str) else []
+# Cantidad de tweets leídos por chunk; acota el pico de memoria de la lectura
+CHUNK_SIZE = 20000
 
-def process_chunk_parallel(args):
-    """Procesamiento paralelo de chunks con vectorización."""
-    chunk, pattern = args
-    mentions = []
-    for text in chunk:
-        mentions.extend(extract_mentions_fast(text, pattern))
-    return pd.Series(mentions).value_counts()
+def extract_mentions_fast(text: str) -> Iterator[str]:
+    """
+    Extracción rápida de menciones usando regex precompilado.
+    Entrega las menciones como iterador para contarlas sin materializar la lista.
+    """
+    return iter_mentions(text) if isinstance(text, str) else iter(())
+
+def process_chunk_parallel(text: str) -> Counter:
+    """
+    Cuenta las menciones de un chunk en un proceso worker.
+    Recibe los textos del chunk unidos por '\\n': el separador no puede formar
+    parte de una mención, así que un solo recorrido del regex da los mismos
+    matches que tweet por tweet.
+    """
+    return Counter(extract_mentions_fast(text))
 
 @profile
 def q3_time(file_path: str) -> List[Tuple[str, int]]:
@@ -36,35 +44,37 @@ def q3_time(file_path: str) -> List[Tuple[str, int]]:
     try:
         logger.info("Iniciando lectura del archivo de tweets")
         
-        # 1. Lectura completa en memoria
-        df = pd.read_json(file_path, lines=True)
-        logger.info(f"Leídos {len(df)} tweets")
-        
-        # 2. Precompilación de regex y preparación de chunks
-        pattern = re.compile(r'@([a-zA-Z0-9_]+)')
+        # 1. El regex de menciones está precompilado en src.utils.mentions
         n_cores = multiprocessing.cpu_count()
-        chunk_size = max(1000, len(df) // (n_cores * 4))
-        chunks = np.array_split(df['content'].values, n_cores * 4)
         
-        # 3. Procesamiento paralelo con preallocación
+        # 2. Lectura por chunks; cada chunk se reparte entre los cores a medida que se lee.
+        # Cada parte viaja como un único string, más barato de serializar que una lista
+        def iter_chunks(reader):
+            tweets_read = 0
+            for df in reader:
+                tweets_read += len(df)
+                logger.info(f"Leídos {tweets_read} tweets")
+                for chunk in np.array_split(df['content'].values, n_cores):
+                    yield '\n'.join(text for text in chunk if isinstance(text, str))
+        
+        # 3. Procesamiento paralelo
         logger.info(f"Iniciando procesamiento paralelo con {n_cores} cores")
-        with multiprocessing.Pool(n_cores) as pool:
-            # Usar imap_unordered para mejor rendimiento
-            chunk_results = list(pool.imap_unordered(
+        with multiprocessing.Pool(n_cores) as pool, \
+                pd.read_json(file_path, lines=True, chunksize=CHUNK_SIZE) as reader:
+            # 4. Usar imap_unordered y combinar cada Counter parcial a medida que llega
+            final_counts = Counter()
+            for chunk_counts in pool.imap_unordered(
                 process_chunk_parallel,
-                [(chunk, pattern) for chunk in chunks],
+                iter_chunks(reader),
                 chunksize=1
-            ))
-        
-        # 4. Combinar resultados eficientemente
-        logger.info("Combinando resultados...")
-        final_counts = pd.concat(chunk_results).groupby(level=0).sum()
+            ):
+                final_counts += chunk_counts
         
         # 5. Ordenar y obtener top 10
-        top_mentions = final_counts.nlargest(10)
+        top_mentions = final_counts.most_common(10)
         
         logger.info(f"Análisis completado: encontradas {len(final_counts)} menciones únicas")
-        return list(zip(top_mentions.index, top_mentions.values))
+        return top_mentions
         
     except Exception as error:
         logger.error(f"Error en el análisis: {error}")
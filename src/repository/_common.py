@@ -0,0 +1,165 @@
+"""Loop de lectura compartido por los repositorios optimizados."""
+import logging
+from typing import Iterable, Iterator, List, Optional, Tuple
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from itertools import starmap
+from zipfile import ZipFile
+import orjson
+from operator import itemgetter
+from ..utils.files import is_zip_path, iter_line_blocks, iter_prefetched_blocks, open_json_stream
+from .models import Tweet, parse_iso_datetime
+from .tweet_repository import TweetRepository
+
+logger = logging.getLogger(__name__)
+
+# Errores que indican una línea inválida del dump (orjson.JSONDecodeError es un
+# ValueError, igual que una fecha mal formada); cualquier otro es un bug y se propaga
+_INVALID_LINE_ERRORS = (ValueError, KeyError, TypeError)
+
+# Tamaño aproximado de cada bloque de líneas enviado a un worker (4 MB)
+BLOCK_SIZE = 1 << 22
+
+# Extrae los campos usados en una sola llamada en C; un campo faltante lanza KeyError
+_extract_fields = itemgetter('date', 'user', 'content')
+
+def log_invalid_line(error: Exception) -> None:
+    """Registra una línea omitida solo si el nivel DEBUG está habilitado."""
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Línea inválida omitida: %s", error)
+
+def extract_raw_fields(line: bytes) -> Tuple[str, str, str]:
+    """
+    Extrae (fecha ISO sin parsear, username, text) de una línea del dump.
+
+    El dump es de esquema fijo y confiable, por lo que no se valida más allá
+    de la presencia de los campos.
+
+    Raises:
+        orjson.JSONDecodeError: Si la línea no es JSON válido
+        KeyError: Si falta alguno de los campos
+    """
+    date, user, content = _extract_fields(orjson.loads(line))
+    return date, user['username'] if isinstance(user, dict) else user, content
+
+def parse_fields(line: bytes) -> Tuple[datetime, str, str]:
+    """
+    Extrae (created_at, username, text) de una línea del dump.
+
+    Raises:
+        orjson.JSONDecodeError: Si la línea no es JSON válido
+        KeyError: Si falta alguno de los campos
+    """
+    date, username, content = extract_raw_fields(line)
+    return parse_iso_datetime(date), username, content
+
+def parse_block(block: bytes) -> List[Tuple[datetime, str, str]]:
+    """
+    Parsea un bloque de líneas en un proceso worker, omitiendo las inválidas.
+    Devuelve tuplas en lugar de Tweets: el proceso principal los construye.
+    """
+    rows = []
+    append = rows.append
+    for line in block.splitlines():
+        try:
+            append(parse_fields(line))
+        except _INVALID_LINE_ERRORS as error:
+            log_invalid_line(error)
+    return rows
+
+def iter_tweets_from_lines(lines: Iterable[bytes]) -> Iterator[Tweet]:
+    """Construye los tweets de las líneas dadas, omitiendo las inválidas."""
+    for line in lines:
+        try:
+            yield Tweet(*parse_fields(line))
+        except _INVALID_LINE_ERRORS as error:
+            log_invalid_line(error)
+
+def iter_lines(file_path: str, zip_file: Optional[ZipFile] = None) -> Iterator[bytes]:
+    """
+    Recorre las líneas del ZIP (o del JSONL ya extraído).
+
+    Con un ZIP, la descompresión corre en un hilo aparte y se solapa con el
+    parseo; un JSONL extraído se lee directamente. Si se entrega un ZipFile
+    ya abierto, se reutiliza.
+    """
+    if not is_zip_path(file_path):
+        with open_json_stream(file_path) as json_file:
+            yield from json_file
+        return
+
+    for block in iter_prefetched_blocks(file_path, zip_file=zip_file):
+        yield from block.splitlines()
+
+def iter_tweets_from_zip(file_path: str, zip_file: Optional[ZipFile] = None) -> Iterator[Tweet]:
+    """Lee los tweets del ZIP (o del JSONL ya extraído) uno a uno."""
+    return iter_tweets_from_lines(iter_lines(file_path, zip_file))
+
+def iter_fields(file_path: str, zip_file: Optional[ZipFile] = None) -> Iterator[Tuple[datetime, str, str]]:
+    """
+    Recorre (created_at, username, text) de cada tweet, omitiendo las líneas
+    inválidas. Usa el mismo parseo que iter_tweets.
+    """
+    for line in iter_lines(file_path, zip_file):
+        try:
+            yield parse_fields(line)
+        except _INVALID_LINE_ERRORS as error:
+            log_invalid_line(error)
+
+def iter_tweets_parallel(file_path: str, workers: int,
+                         zip_file: Optional[ZipFile] = None) -> Iterator[Tweet]:
+    """
+    Parsea bloques de líneas en paralelo y entrega los tweets en el orden del archivo.
+
+    El proceso principal descomprime y reparte bloques alineados a fin de
+    línea; se limita la cantidad de bloques en vuelo para acotar el uso de memoria.
+    """
+    max_pending = workers * 2
+    pending = deque()
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for block in iter_line_blocks(file_path, BLOCK_SIZE, zip_file):
+            pending.append(executor.submit(parse_block, block))
+            if len(pending) >= max_pending:
+                yield from starmap(Tweet, pending.popleft().result())
+        while pending:
+            yield from starmap(Tweet, pending.popleft().result())
+
+def iter_tweets(file_path: str, workers: int = 1,
+                zip_file: Optional[ZipFile] = None) -> Iterator[Tweet]:
+    """Lee los tweets secuencialmente o, con más de un worker, en paralelo."""
+    if workers > 1:
+        return iter_tweets_parallel(file_path, workers, zip_file)
+    return iter_tweets_from_zip(file_path, zip_file)
+
+class ZipBackedRepository(TweetRepository):
+    """
+    Base de los repositorios optimizados: mantiene abierto el ZIP entre
+    llamadas a get_tweets, de modo que el directorio central se lee una sola
+    vez. Se libera con close() o usando el repositorio como context manager.
+    """
+
+    def __init__(self, file_path: str, workers: int = 1):
+        self.file_path = file_path
+        # Con más de un worker el parseo de JSON se reparte entre procesos
+        self.workers = workers
+        self._zip_file: Optional[ZipFile] = None
+
+    @property
+    def zip_file(self) -> Optional[ZipFile]:
+        """ZipFile abierto en el primer uso; None si la ruta es un JSONL extraído."""
+        if self._zip_file is None and is_zip_path(self.file_path):
+            self._zip_file = ZipFile(self.file_path)
+        return self._zip_file
+
+    def close(self) -> None:
+        """Cierra el ZIP si quedó abierto."""
+        if self._zip_file is not None:
+            self._zip_file.close()
+            self._zip_file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
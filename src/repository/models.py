@@ -1,33 +1,86 @@
-from pydantic import BaseModel, Field, field_validator
+from dataclasses import dataclass
 from datetime import datetime
-from typing import Optional
+from typing import Any, Dict, Iterator, List, Tuple
+from ..utils.mentions import MENTION_PATTERN
+
+@dataclass(frozen=True)
+class Tweet:
+    """
+    Modelo que representa un Tweet con los campos mínimos necesarios.
+    Usa __slots__ para evitar el __dict__ por instancia.
+    """
+    __slots__ = ('created_at', 'username', 'text')
 
-class Tweet(BaseModel):
-    """Modelo que representa un Tweet con los campos mínimos necesarios."""
     created_at: datetime
-    username: str = Field(alias='user_name')
+    username: str
     text: str
 
-    @field_validator('username', mode='before')
-    @classmethod
-    def extract_username(cls, value):
-        """Extrae el username del objeto de usuario si es necesario."""
-        if isinstance(value, dict):
-            return value.get('username', '')
-        return value
-
-    @field_validator('text', mode='before')
-    @classmethod
-    def extract_text(cls, value):
-        """Extrae el texto del tweet."""
-        if isinstance(value, dict):
-            return value.get('content', '')
-        return value
-
-    class Config:
-        """Configuración del modelo para optimizar memoria."""
-        frozen = True
-        extra = 'ignore'
+    @property
+    def mentions(self) -> Tuple[str, ...]:
+        """
+        Usernames mencionados en el texto, calculados al acceder.
+        No se cachean: con __slots__ el Tweet no tiene __dict__ donde guardarlos.
+        """
+        return tuple(MENTION_PATTERN.findall(self.text))
+
+    def __reduce__(self):
+        # Con __slots__ y frozen=True el protocolo por defecto falla al
+        # restaurar los campos; se reconstruye llamando al constructor
+        return Tweet, (self.created_at, self.username, self.text)
 
     def __str__(self) -> str:
-        return f"Tweet(username={self.username}, created_at={self.created_at.date()})"
\ No newline at end of file
+        return f"Tweet(username={self.username}, created_at={self.created_at.date()})"
+
+@dataclass(frozen=True)
+class TweetColumns:
+    """
+    Tweets en formato columnar (SoA): una lista por campo en lugar de un
+    objeto por tweet. Los usernames repetidos comparten el mismo objeto str.
+    """
+    __slots__ = ('created_at', 'usernames', 'texts')
+
+    created_at: List[datetime]
+    usernames: List[str]
+    texts: List[str]
+
+    def __len__(self) -> int:
+        return len(self.texts)
+
+    def __iter__(self) -> Iterator[Tweet]:
+        """Materializa los Tweets de a uno, solo si se recorren."""
+        return map(Tweet, self.created_at, self.usernames, self.texts)
+
+    def __reduce__(self):
+        # Mismo motivo que en Tweet
+        return TweetColumns, (self.created_at, self.usernames, self.texts)
+
+def parse_iso_datetime(date_str: str) -> datetime:
+    """
+    Parsea una fecha ISO 8601 del dump con el parser en C de datetime.
+    Solo reescribe el sufijo 'Z' cuando está presente (fromisoformat no lo
+    acepta antes de Python 3.11); el formato habitual '+00:00' pasa directo.
+
+    Raises:
+        TypeError: Si la fecha no es un string (p. ej. null en el dump)
+        ValueError: Si el string no es una fecha ISO 8601 válida
+    """
+    if not isinstance(date_str, str):
+        raise TypeError(f"Fecha inválida: {date_str!r}")
+    if date_str.endswith('Z'):
+        date_str = date_str[:-1] + '+00:00'
+    return datetime.fromisoformat(date_str)
+
+def make_tweet(data: Dict[str, Any]) -> Tweet:
+    """
+    Crea un Tweet a partir de un diccionario con las claves created_at,
+    user_name y text, extrayendo el username y el texto si vienen anidados.
+    """
+    username = data['user_name']
+    if isinstance(username, dict):
+        username = username.get('username', '')
+
+    text = data['text']
+    if isinstance(text, dict):
+        text = text.get('content', '')
+
+    return Tweet(data['created_at'], username, text)
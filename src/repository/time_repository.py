@@ -1,28 +1,32 @@
-from typing import Iterator
-import json
-from zipfile import ZipFile
-from .tweet_repository import TweetRepository
-from .models import Tweet
+from typing import Dict, Iterator
+from .models import Tweet, TweetColumns
+from ._common import ZipBackedRepository, iter_fields, iter_tweets
 
-class TimeOptimizedRepository(TweetRepository):
+class TimeOptimizedRepository(ZipBackedRepository):
     """Implementación optimizada para tiempo del repositorio."""
-    
-    def __init__(self, file_path: str):
-        self.file_path = file_path
+
+    def load_columns(self) -> TweetColumns:
+        """
+        Carga todos los tweets en memoria en formato columnar.
+        
+        Las fechas se parsean igual que en iter_tweets, de modo que el
+        resultado no depende de la cantidad de workers; los usernames
+        repetidos se deduplican con un pool.
+        """
+        created_at, usernames, texts = [], [], []
+        username_pool: Dict[str, str] = {}
+        for date, username, text in iter_fields(self.file_path, self.zip_file):
+            created_at.append(date)
+            usernames.append(username_pool.setdefault(username, username))
+            texts.append(text)
+        return TweetColumns(created_at, usernames, texts)
 
     def get_tweets(self) -> Iterator[Tweet]:
-        """Lee todos los tweets en memoria para optimizar tiempo."""
-        with ZipFile(self.file_path) as zip_file:
-            json_filename = zip_file.namelist()[0]
-            with zip_file.open(json_filename) as json_file:
-                for line in json_file:
-                    try:
-                        tweet_data = json.loads(line.decode('utf-8'))
-                        processed_data = {
-                            'created_at': tweet_data.get('date'),
-                            'user_name': tweet_data.get('user', {}),
-                            'text': tweet_data.get('content', '')
-                        }
-                        yield Tweet(**processed_data)
-                    except Exception:
-                        continue 
\ No newline at end of file
+        """
+        Lee todos los tweets en memoria para optimizar tiempo.
+        Con un solo worker se cargan en columnas y los Tweets se materializan
+        al recorrerlos; con varios, se parsean en paralelo.
+        """
+        if self.workers > 1:
+            return iter(list(iter_tweets(self.file_path, self.workers, self.zip_file)))
+        return iter(self.load_columns())
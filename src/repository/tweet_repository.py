@@ -1,7 +1,7 @@
 from abc import ABC, abstractmethod
-from typing import AsyncIterator, Dict, Any
-from zipfile import ZipFile
+from typing import AsyncIterator, Iterator, Dict, Any
 import logging
+import orjson
 from datetime import datetime
 from ..utils.exceptions import (
     TweetRepositoryError,
@@ -9,7 +9,8 @@ from ..utils.exceptions import (
     InvalidFileFormatError,
     JsonParsingError
 )
-from .models import Tweet
+from ..utils.files import open_json_stream
+from .models import Tweet, make_tweet, parse_iso_datetime
 
 logger = logging.getLogger(__name__)
 
@@ -28,7 +29,7 @@ class JsonParser:
     def parse_date(date_str: str) -> datetime:
         """Parsea una fecha del formato ISO a datetime."""
         try:
-            return datetime.fromisoformat(date_str.replace('Z', '+00:00'))
+            return parse_iso_datetime(date_str)
         except ValueError as error:
             logger.warning(f"Error parsing date: {date_str}, using current datetime")
             return datetime.utcnow()
@@ -37,9 +38,7 @@ class JsonParser:
     def create_tweet(data: Dict[str, Any]) -> Tweet:
         """Crea un objeto Tweet a partir de un diccionario de datos."""
         try:
-            tweet = Tweet(**data)
-            tweet.mentions = tweet.extract_mentions()
-            return tweet
+            return make_tweet(data)
         except Exception as error:
             raise JsonParsingError(f"Error creating tweet: {error}")
 
@@ -56,34 +55,51 @@ class JsonTweetRepository(TweetRepository):
         if not self.file_path.endswith('.zip'):
             raise InvalidFileFormatError("El archivo debe ser un ZIP")
 
+    def _iter_json_objects(self, json_file) -> Iterator[Dict[str, Any]]:
+        """
+        Entrega los objetos JSON del archivo.
+        
+        El archivo es NDJSON (un tweet por línea) y cada línea se parsea con
+        orjson. Solo si el contenido es un arreglo JSON se recurre a ijson.items,
+        que entrega objetos completos sin un evento por token.
+        """
+        if json_file.peek(64).lstrip()[:1] == b'[':
+            import ijson
+            try:
+                yield from ijson.items(json_file, 'item')
+            except ijson.JSONError as error:
+                raise JsonParsingError(f"Error parsing JSON: {error}")
+            return
+
+        for line in json_file:
+            if not line.strip():
+                continue
+            try:
+                yield orjson.loads(line)
+            except orjson.JSONDecodeError as error:
+                raise JsonParsingError(f"Error parsing JSON: {error}")
+
+    def _to_tweet_data(self, obj: Dict[str, Any]) -> Dict[str, Any]:
+        """Normaliza un objeto del dump (date, user, content) a los campos de Tweet."""
+        created_at = obj.get('created_at', obj.get('date'))
+        if isinstance(created_at, str):
+            created_at = self.parser.parse_date(created_at)
+        return {
+            'created_at': created_at,
+            'user_name': obj.get('user_name', obj.get('user', {})),
+            'text': obj.get('text', obj.get('content', ''))
+        }
+
     async def _process_json_stream(self, json_file) -> AsyncIterator[Tweet]:
         """Procesa el stream de JSON y genera tweets."""
-        current_obj: Dict[str, Any] = {}
         tweets_processed = 0
 
-        try:
-            import ijson
-            parser = ijson.parse(json_file)
-
-            for prefix, event, value in parser:
-                if prefix.endswith('.user_name'):
-                    current_obj['user_name'] = value
-                elif prefix.endswith('.created_at'):
-                    current_obj['created_at'] = self.parser.parse_date(value)
-                elif prefix.endswith('.text'):
-                    current_obj['text'] = value
-                    tweets_processed += 1
-                    
-                    if tweets_processed % 1000 == 0:
-                        logger.info(f"Procesados {tweets_processed} tweets")
-
-                    try:
-                        yield self.parser.create_tweet(current_obj)
-                    finally:
-                        current_obj = {}
-
-        except ijson.JSONError as error:
-            raise JsonParsingError(f"Error parsing JSON: {error}")
+        for obj in self._iter_json_objects(json_file):
+            tweets_processed += 1
+            if tweets_processed % 1000 == 0:
+                logger.info(f"Procesados {tweets_processed} tweets")
+
+            yield self.parser.create_tweet(self._to_tweet_data(obj))
 
     async def get_tweets(self) -> AsyncIterator[Tweet]:
         """
@@ -101,13 +117,10 @@ class JsonTweetRepository(TweetRepository):
         self._validate_file()
 
         try:
-            with ZipFile(self.file_path) as zip_file:
-                json_filename = zip_file.namelist()[0]
-                logger.info(f"Procesando archivo JSON: {json_filename}")
-
-                with zip_file.open(json_filename) as json_file:
-                    async for tweet in self._process_json_stream(json_file):
-                        yield tweet
+            logger.info(f"Procesando archivo JSON: {self.file_path}")
+            with open_json_stream(self.file_path) as json_file:
+                async for tweet in self._process_json_stream(json_file):
+                    yield tweet
 
         except FileNotFoundError as error:
             raise FileNotFoundError(f"Archivo no encontrado: {self.file_path}")
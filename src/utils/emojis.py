@@ -0,0 +1,34 @@
+"""Patrón precompilado para localizar emojis en el texto de los tweets."""
+import re
+from typing import Iterable, List, Tuple
+
+import emoji
+
+def codepoint_ranges(codepoints: Iterable[int]) -> List[Tuple[int, int]]:
+    """Agrupa codepoints en rangos contiguos (inicio, fin) inclusivos."""
+    ranges: List[Tuple[int, int]] = []
+    for codepoint in sorted(set(codepoints)):
+        if ranges and codepoint == ranges[-1][1] + 1:
+            ranges[-1] = (ranges[-1][0], codepoint)
+        else:
+            ranges.append((codepoint, codepoint))
+    return ranges
+
+def build_emoji_pattern() -> re.Pattern:
+    """
+    Construye una clase de caracteres con los emojis de un solo codepoint.
+
+    Equivale a evaluar `c in emoji.EMOJI_DATA` carácter a carácter (las
+    secuencias de varios codepoints nunca coinciden con un carácter aislado),
+    pero el recorrido del texto lo hace el motor de `re` en C.
+    """
+    codepoints = (ord(key) for key in emoji.EMOJI_DATA if len(key) == 1)
+    parts = []
+    for start, end in codepoint_ranges(codepoints):
+        if start == end:
+            parts.append(re.escape(chr(start)))
+        else:
+            parts.append(f"{re.escape(chr(start))}-{re.escape(chr(end))}")
+    return re.compile(f"[{''.join(parts)}]")
+
+EMOJI_PATTERN = build_emoji_pattern()
@@ -0,0 +1,242 @@
+"""Utilidades para abrir el archivo de tweets, comprimido (ZIP) o ya extraído (JSONL)."""
+import io
+import logging
+import mmap
+import os
+import queue
+import shutil
+import threading
+from contextlib import contextmanager
+from typing import BinaryIO, Iterator, List, Optional, Tuple
+from zipfile import ZipFile
+
+from src.utils.exceptions import TweetRepositoryError
+
+logger = logging.getLogger(__name__)
+
+# Buffer de lectura por defecto sobre el stream de tweets (256 KB)
+READ_BUFFER_SIZE = 1 << 18
+
+# Tamaño de copia al extraer el ZIP (1 MB)
+COPY_BUFFER_SIZE = 1 << 20
+
+# Bloques leídos por adelantado en el hilo de descompresión (8 x 1 MB)
+PREFETCH_BLOCK_SIZE = 1 << 20
+PREFETCH_MAX_BLOCKS = 8
+
+_END_OF_STREAM = object()
+
+def is_zip_path(file_path: str) -> bool:
+    """Indica si la ruta corresponde a un archivo ZIP según su extensión."""
+    return file_path.lower().endswith('.zip')
+
+def get_json_member(zip_file: ZipFile) -> str:
+    """
+    Obtiene el nombre del archivo JSON dentro del ZIP.
+
+    Raises:
+        TweetRepositoryError: Si el ZIP está vacío
+    """
+    try:
+        return zip_file.namelist()[0]
+    except IndexError:
+        logger.error("El archivo ZIP %s está vacío", zip_file.filename)
+        raise TweetRepositoryError("El archivo ZIP está vacío")
+
+@contextmanager
+def open_json_stream(file_path: str, buffer_size: int = READ_BUFFER_SIZE,
+                     zip_file: Optional[ZipFile] = None) -> Iterator[BinaryIO]:
+    """
+    Abre el archivo de tweets en modo binario con un buffer de lectura amplio.
+
+    Si la ruta es un ZIP se descomprime el primer archivo en streaming; en otro
+    caso se asume un JSONL ya extraído y se lee directamente, sin inflate.
+    Si se entrega un ZipFile ya abierto se reutiliza y no se vuelve a leer
+    el directorio central; su cierre queda a cargo de quien lo abrió.
+
+    Args:
+        file_path: Ruta al ZIP con los tweets o al JSONL extraído
+        buffer_size: Tamaño del buffer de lectura
+        zip_file: ZipFile ya abierto sobre file_path (opcional)
+
+    Yields:
+        Stream binario iterable por líneas
+
+    Raises:
+        FileNotFoundError: Si el archivo no existe
+        BadZipFile: Si el ZIP está corrupto
+        TweetRepositoryError: Si el ZIP está vacío
+    """
+    if not is_zip_path(file_path):
+        with open(file_path, 'rb', buffering=buffer_size) as json_file:
+            yield json_file
+        return
+
+    if zip_file is None:
+        with ZipFile(file_path) as zip_file:
+            with open_json_member(zip_file, buffer_size) as json_file:
+                yield json_file
+        return
+
+    with open_json_member(zip_file, buffer_size) as json_file:
+        yield json_file
+
+@contextmanager
+def open_json_member(zip_file: ZipFile, buffer_size: int = READ_BUFFER_SIZE) -> Iterator[BinaryIO]:
+    """Abre el JSON dentro de un ZipFile ya abierto con un buffer de lectura amplio."""
+    json_filename = get_json_member(zip_file)
+    with zip_file.open(json_filename) as raw_file, \
+            io.BufferedReader(raw_file, buffer_size=buffer_size) as json_file:
+        yield json_file
+
+def extract_json(file_path: str) -> str:
+    """
+    Descomprime el JSONL del ZIP junto al archivo original y reutiliza la copia.
+
+    La copia (p. ej. data/tweets.json para data/tweets.json.zip) se considera
+    vigente si su tamaño coincide con el declarado en el ZIP y no es más antigua
+    que el ZIP. Así las ejecuciones siguientes evitan el inflate por completo.
+
+    Args:
+        file_path: Ruta al archivo ZIP con los tweets
+
+    Returns:
+        Ruta al JSONL extraído (o la misma ruta si no es un ZIP)
+    """
+    if not is_zip_path(file_path):
+        return file_path
+
+    target_path = file_path[:-len('.zip')]
+    with ZipFile(file_path) as zip_file:
+        json_filename = get_json_member(zip_file)
+        expected_size = zip_file.getinfo(json_filename).file_size
+
+        if (os.path.exists(target_path)
+                and os.path.getsize(target_path) == expected_size
+                and os.path.getmtime(target_path) >= os.path.getmtime(file_path)):
+            logger.info("Reutilizando archivo extraído: %s", target_path)
+            return target_path
+
+        logger.info("Extrayendo %s en %s", json_filename, target_path)
+        temp_path = f"{target_path}.tmp"
+        with zip_file.open(json_filename) as source, open(temp_path, 'wb') as target:
+            shutil.copyfileobj(source, target, COPY_BUFFER_SIZE)
+        os.replace(temp_path, target_path)
+
+    return target_path
+
+def iter_line_blocks(file_path: str, block_size: int,
+                     zip_file: Optional[ZipFile] = None) -> Iterator[bytes]:
+    """
+    Lee el archivo de tweets descomprimido en bloques alineados a fin de línea.
+
+    Args:
+        file_path: Ruta al ZIP con los tweets o al JSONL extraído
+        block_size: Tamaño aproximado de cada bloque en bytes
+        zip_file: ZipFile ya abierto sobre file_path (opcional)
+
+    Yields:
+        Bloques de bytes que contienen solo líneas completas
+    """
+    with open_json_stream(file_path, zip_file=zip_file) as json_file:
+        tail = b''
+        while chunk := json_file.read(block_size):
+            chunk = tail + chunk
+            cut = chunk.rfind(b'\n') + 1
+            if cut == 0:
+                tail = chunk
+                continue
+            tail = chunk[cut:]
+            yield chunk[:cut]
+        if tail:
+            yield tail
+
+def iter_prefetched_blocks(file_path: str, block_size: int = PREFETCH_BLOCK_SIZE,
+                           max_pending: int = PREFETCH_MAX_BLOCKS,
+                           zip_file: Optional[ZipFile] = None) -> Iterator[bytes]:
+    """
+    Igual que iter_line_blocks, pero descomprime en un hilo aparte.
+
+    zlib libera el GIL durante el inflate, por lo que el hilo lector
+    descomprime el siguiente bloque mientras el hilo principal parsea el
+    actual. La cola acotada limita los bloques leídos por adelantado.
+
+    Args:
+        file_path: Ruta al ZIP con los tweets o al JSONL extraído
+        block_size: Tamaño aproximado de cada bloque en bytes
+        max_pending: Cantidad máxima de bloques en cola
+        zip_file: ZipFile ya abierto sobre file_path (opcional)
+
+    Yields:
+        Bloques de bytes que contienen solo líneas completas
+    """
+    blocks: queue.Queue = queue.Queue(maxsize=max_pending)
+    stop = threading.Event()
+
+    def put(item) -> bool:
+        """Encola sin bloquear indefinidamente si el consumidor se detuvo."""
+        while not stop.is_set():
+            try:
+                blocks.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def produce() -> None:
+        try:
+            for block in iter_line_blocks(file_path, block_size, zip_file):
+                if not put(block):
+                    return
+            put(_END_OF_STREAM)
+        except BaseException as error:
+            put(error)
+
+    reader = threading.Thread(target=produce, name='tweets-reader', daemon=True)
+    reader.start()
+    try:
+        while True:
+            item = blocks.get()
+            if item is _END_OF_STREAM:
+                return
+            if isinstance(item, BaseException):
+                raise item
+            yield item
+    finally:
+        stop.set()
+        reader.join()
+
+def split_line_ranges(file_path: str, range_size: int) -> List[Tuple[int, int]]:
+    """
+    Divide un JSONL extraído en rangos de bytes alineados a fin de línea.
+
+    Con mmap solo se leen las páginas alrededor de cada corte, sin recorrer
+    el archivo completo.
+
+    Args:
+        file_path: Ruta al JSONL (no comprimido)
+        range_size: Tamaño mínimo de cada rango en bytes
+
+    Returns:
+        Lista de tuplas (inicio, fin) que cubren el archivo completo
+    """
+    if os.path.getsize(file_path) == 0:
+        return []
+
+    ranges = []
+    with open(file_path, 'rb') as json_file, \
+            mmap.mmap(json_file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        size = len(mapped)
+        start = 0
+        while start < size:
+            newline = mapped.find(b'\n', min(start + range_size, size) - 1)
+            end = size if newline < 0 else newline + 1
+            ranges.append((start, end))
+            start = end
+    return ranges
+
+def read_range(file_path: str, start: int, end: int) -> bytes:
+    """Lee el rango [start, end) de un JSONL extraído mediante mmap."""
+    with open(file_path, 'rb') as json_file, \
+            mmap.mmap(json_file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        return mapped[start:end]
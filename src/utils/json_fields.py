@@ -0,0 +1,104 @@
+"""Extracción puntual de campos de una línea JSON sin parsear el tweet completo."""
+from typing import Optional, Tuple
+
+import orjson
+
+# En el dump, `content` aparece antes que los objetos anidados (quotedTweet, ...),
+# por lo que la primera ocurrencia corresponde al texto del tweet principal.
+CONTENT_MARKER = b'"content":'
+
+_BACKSLASH = ord('\\')
+
+def find_json_string_bounds(line: bytes, marker: bytes, start: int = 0) -> Optional[Tuple[int, int]]:
+    """
+    Ubica el string JSON que sigue a `marker`, sin decodificarlo.
+
+    Respeta comillas escapadas contando los backslashes que las preceden.
+
+    Args:
+        line: Línea JSON del tweet
+        marker: Clave a buscar, incluyendo comillas y dos puntos
+        start: Posición desde la que buscar
+
+    Returns:
+        Tupla (inicio, fin) del valor incluyendo sus comillas, o None si el
+        campo no está o no es un string
+    """
+    position = line.find(marker, start)
+    if position < 0:
+        return None
+    position += len(marker)
+    value_start = line.find(b'"', position)
+    # Entre el marcador y la comilla solo puede haber espacios (descarta null, números, etc.)
+    if value_start < 0 or line[position:value_start].strip():
+        return None
+
+    value_end = value_start
+    while True:
+        value_end = line.find(b'"', value_end + 1)
+        if value_end < 0:
+            return None
+        # La comilla está escapada si la precede un número impar de backslashes
+        backslashes = 0
+        while line[value_end - 1 - backslashes] == _BACKSLASH:
+            backslashes += 1
+        if backslashes % 2 == 0:
+            return value_start, value_end + 1
+
+def find_json_string(line: bytes, marker: bytes, start: int = 0) -> Optional[str]:
+    """
+    Busca el string JSON que sigue a `marker` y decodifica solo ese valor.
+
+    Respeta comillas escapadas y secuencias \\uXXXX (emojis incluidos), pero
+    no construye el resto del objeto: campos como renderedContent, user o
+    quotedTweet nunca se materializan.
+
+    Args:
+        line: Línea JSON del tweet
+        marker: Clave a buscar, incluyendo comillas y dos puntos
+        start: Posición desde la que buscar
+
+    Returns:
+        Valor decodificado o None si el campo no está o no es un string
+
+    Raises:
+        orjson.JSONDecodeError: Si el valor contiene escapes inválidos
+    """
+    bounds = find_json_string_bounds(line, marker, start)
+    if bounds is None:
+        return None
+    return orjson.loads(line[bounds[0]:bounds[1]])
+
+def extract_content(line: bytes) -> Optional[str]:
+    """
+    Obtiene el texto (`content`) de una línea del archivo de tweets.
+
+    Usa la búsqueda directa del campo y recurre a orjson solo si la línea no
+    tiene el formato esperado.
+
+    Raises:
+        orjson.JSONDecodeError: Si la línea no es JSON válido
+    """
+    content = find_json_string(line, CONTENT_MARKER)
+    if content is not None:
+        return content
+    return orjson.loads(line).get('content')
+
+def extract_raw_content(line: bytes) -> Optional[bytes]:
+    """
+    Obtiene el texto (`content`) como bytes sin decodificar los escapes JSON.
+
+    Sirve para búsquedas de patrones ASCII (p. ej. menciones): el dump no
+    escapa letras, dígitos, '_' ni '@', y un escape siempre empieza con '\\',
+    por lo que los matches son los mismos que sobre el texto decodificado.
+    Si la línea no tiene el formato esperado se recurre a orjson y se
+    codifica el texto en UTF-8.
+
+    Raises:
+        orjson.JSONDecodeError: Si la línea no es JSON válido
+    """
+    bounds = find_json_string_bounds(line, CONTENT_MARKER)
+    if bounds is not None:
+        return line[bounds[0] + 1:bounds[1] - 1]
+    content = orjson.loads(line).get('content')
+    return content.encode() if isinstance(content, str) else None
@@ -0,0 +1,24 @@
+"""Patrón precompilado para localizar menciones (@usuario) en el texto de los tweets."""
+import re
+from operator import itemgetter
+from typing import AnyStr, Iterator
+
+# Caracteres válidos de un username de Twitter: letras ASCII, dígitos y '_'
+_MENTION_REGEX = r'@([a-zA-Z0-9_]+)'
+
+MENTION_PATTERN = re.compile(_MENTION_REGEX)
+
+# Misma clase sobre bytes: las menciones son ASCII, por lo que se pueden
+# buscar en el texto sin decodificarlo
+MENTION_PATTERN_BYTES = re.compile(_MENTION_REGEX.encode('ascii'))
+
+# Extrae el username (grupo 1) de cada match de mención
+mention_name = itemgetter(1)
+
+def iter_mentions(text: AnyStr) -> Iterator[AnyStr]:
+    """
+    Entrega los usernames mencionados en el texto, como str o bytes según
+    el tipo del texto, sin materializar una lista intermedia.
+    """
+    pattern = MENTION_PATTERN_BYTES if isinstance(text, bytes) else MENTION_PATTERN
+    return map(mention_name, pattern.finditer(text))
@@ -0,0 +1,16 @@
+"""Decorador de profiling de memoria activable por variable de entorno."""
+import os
+from typing import Callable, TypeVar
+
+F = TypeVar('F', bound=Callable)
+
+def _no_profile(func: F) -> F:
+    """Devuelve la función sin instrumentar."""
+    return func
+
+# memory_profiler traza cada línea ejecutada y mide el RSS, lo que ralentiza
+# los loops por tweet. Solo se activa con MEM_PROFILE=1.
+if os.environ.get('MEM_PROFILE'):
+    from memory_profiler import profile
+else:
+    profile = _no_profile
@@ -0,0 +1,77 @@
+import threading
+import zipfile
+import zlib
+
+import pytest
+
+from src.utils.files import iter_prefetched_blocks, read_range, split_line_ranges
+
+def write_lines(path, count, trailing_newline=True):
+    data = b'\n'.join(b'{"id": %d, "content": "%s"}' % (i, b'x' * (i % 7)) for i in range(count))
+    if trailing_newline:
+        data += b'\n'
+    path.write_bytes(data)
+    return data
+
+@pytest.mark.parametrize('trailing_newline', [True, False])
+@pytest.mark.parametrize('range_size', [1, 10, 64, 1 << 20])
+def test_ranges_rejoin_to_original(tmp_path, trailing_newline, range_size):
+    path = tmp_path / 'tweets.json'
+    data = write_lines(path, 50, trailing_newline)
+
+    ranges = split_line_ranges(str(path), range_size)
+    chunks = [read_range(str(path), start, end) for start, end in ranges]
+
+    assert b''.join(chunks) == data
+    # Cada rango termina en fin de línea, salvo el último si el archivo no lo tiene
+    assert all(chunk.endswith(b'\n') for chunk in chunks[:-1])
+    assert [start for start, _ in ranges[1:]] == [end for _, end in ranges[:-1]]
+
+def test_range_larger_than_file_is_single_range(tmp_path):
+    path = tmp_path / 'tweets.json'
+    data = write_lines(path, 3, trailing_newline=False)
+
+    assert split_line_ranges(str(path), len(data) * 10) == [(0, len(data))]
+
+def test_empty_file_has_no_ranges(tmp_path):
+    path = tmp_path / 'tweets.json'
+    path.write_bytes(b'')
+
+    assert split_line_ranges(str(path), 64) == []
+
+def reader_threads():
+    return [thread for thread in threading.enumerate() if thread.name == 'tweets-reader']
+
+def test_prefetch_close_mid_stream_joins_reader(tmp_path):
+    path = tmp_path / 'tweets.json.zip'
+    with zipfile.ZipFile(path, 'w', zipfile.ZIP_DEFLATED) as zip_file:
+        zip_file.writestr('tweets.json', write_lines(tmp_path / 'plain.json', 5000))
+
+    blocks = iter_prefetched_blocks(str(path), block_size=256, max_pending=2)
+    assert next(blocks).endswith(b'\n')
+    assert reader_threads()
+
+    blocks.close()
+    assert not reader_threads()
+
+def test_prefetch_reraises_reader_error_and_joins_reader(tmp_path):
+    path = tmp_path / 'tweets.json.zip'
+    path.write_bytes(b'PK\x03\x04 esto no es un zip')
+
+    with pytest.raises(zipfile.BadZipFile):
+        list(iter_prefetched_blocks(str(path)))
+    assert not reader_threads()
+
+def test_prefetch_reraises_corrupt_member_and_joins_reader(tmp_path):
+    path = tmp_path / 'tweets.json.zip'
+    with zipfile.ZipFile(path, 'w', zipfile.ZIP_DEFLATED) as zip_file:
+        zip_file.writestr('tweets.json', write_lines(tmp_path / 'plain.json', 5000))
+    # Corrompe los datos comprimidos, después del encabezado local
+    data = bytearray(path.read_bytes())
+    data[200:400] = b'\xff' * 200
+    path.write_bytes(bytes(data))
+
+    with pytest.raises((zipfile.BadZipFile, zlib.error)):
+        for _ in iter_prefetched_blocks(str(path), block_size=256):
+            pass
+    assert not reader_threads()
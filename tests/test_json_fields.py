@@ -0,0 +1,73 @@
+import json
+
+import orjson
+import pytest
+
+from src.utils.json_fields import (
+    CONTENT_MARKER,
+    extract_content,
+    extract_raw_content,
+    find_json_string,
+    find_json_string_bounds,
+)
+from src.utils.mentions import iter_mentions
+
+def dump_line(content: str, ensure_ascii: bool = False) -> bytes:
+    """Serializa un tweet mínimo como lo haría el dump."""
+    if ensure_ascii:
+        return json.dumps({'content': content, 'user': {'username': 'ana'}}).encode()
+    return orjson.dumps({'content': content, 'user': {'username': 'ana'}})
+
+@pytest.mark.parametrize('content', [
+    'sin escapes',
+    'comilla \\" escapada',
+    'termina en backslash \\',
+    'dos backslashes \\\\',
+    'backslash y comilla \\\\" al final "',
+    '"',
+    '',
+])
+def test_bounds_respect_escaped_quotes(content):
+    line = dump_line(content)
+    start, end = find_json_string_bounds(line, CONTENT_MARKER)
+
+    assert orjson.loads(line[start:end]) == content
+    assert line[end:].startswith(b',"user"')
+
+def test_bounds_counts_backslashes_before_quote():
+    # Tres backslashes antes de la comilla: el último la escapa
+    line = b'{"content":"a\\\\\\"b","id":1}'
+    assert find_json_string(line, CONTENT_MARKER) == 'a\\"b'
+    # Dos backslashes: la comilla cierra el string
+    line = b'{"content":"a\\\\","id":1}'
+    assert find_json_string(line, CONTENT_MARKER) == 'a\\'
+
+@pytest.mark.parametrize('line', [
+    b'{"content": null, "id": 1}',
+    b'{"content": 5, "id": "x"}',
+    b'{"id": 1}',
+    b'{"content": "sin cierre',
+])
+def test_bounds_reject_non_strings(line):
+    assert find_json_string_bounds(line, CONTENT_MARKER) is None
+
+def test_extract_content_falls_back_to_orjson():
+    assert extract_content(b'{"id": 1, "content" : "hola"}') == 'hola'
+    assert extract_content(b'{"content": null}') is None
+
+@pytest.mark.parametrize('content', [
+    'linea\n@ana y @beto',
+    '@ana\n@beto',
+    'tab\t@ana\t',
+    '"@ana" entre comillas',
+    'emoji 🙏@ana🙏 pegado',
+    'acento é@beto_1é',
+    'barra \\@ana',
+    'correo x@ana.com',
+])
+@pytest.mark.parametrize('ensure_ascii', [False, True])
+def test_raw_content_mentions_match_decoded_text(content, ensure_ascii):
+    line = dump_line(content, ensure_ascii)
+    raw_mentions = [name.decode() for name in iter_mentions(extract_raw_content(line))]
+
+    assert raw_mentions == list(iter_mentions(content))
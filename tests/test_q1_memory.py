@@ -0,0 +1,94 @@
+import importlib
+import random
+import zipfile
+from datetime import date
+
+import orjson
+import pytest
+
+from src.queries.dates.q1_memory import q1_memory
+
+q1_memory_module = importlib.import_module('src.queries.dates.q1_memory')
+
+def tweet_line(date_value, username, **extra) -> bytes:
+    """Serializa un tweet mínimo con el orden de campos del dump."""
+    return orjson.dumps({'date': date_value, 'content': 'hola', 'user': {'username': username}, **extra})
+
+def write_zip(path, lines):
+    with zipfile.ZipFile(path, 'w', zipfile.ZIP_DEFLATED) as zip_file:
+        zip_file.writestr('tweets.json', b'\n'.join(lines) + b'\n')
+    return str(path)
+
+@pytest.mark.parametrize('workers', [1, 2])
+def test_invalid_date_skips_only_its_line(tmp_path, workers):
+    path = write_zip(tmp_path / 'tweets.json.zip', [
+        tweet_line('2021-02-01T10:00:00+00:00', 'bo'),
+        tweet_line('not-a-date', 'ana'),
+        tweet_line('2021-13-45T10:00:00+00:00', 'ana'),
+    ])
+
+    assert q1_memory(path, workers=workers) == [(date(2021, 2, 1), 'bo')]
+
+def shuffled_lines():
+    """
+    Tweets en orden aleatorio: cada día d tiene d+1 tweets por usuario y
+    'top' suma uno extra. Un conteo que dependa del orden falla el top user.
+    """
+    lines = []
+    for day in range(1, 16):
+        for username in ('ana', 'beto', 'top'):
+            repetitions = day + 1 + (username == 'top')
+            lines += [tweet_line(f'2021-02-{day:02d}T10:00:00+00:00', username)] * repetitions
+    random.Random(7).shuffle(lines)
+    return lines
+
+def test_top_user_on_unsorted_input(tmp_path):
+    path = write_zip(tmp_path / 'tweets.json.zip', shuffled_lines())
+
+    result = q1_memory(path)
+
+    assert result == [(date(2021, 2, day), 'top') for day in range(15, 5, -1)]
+
+@pytest.mark.parametrize('extracted', [False, True])
+def test_parallel_matches_sequential(tmp_path, monkeypatch, extracted):
+    lines = shuffled_lines()
+    if extracted:
+        path = tmp_path / 'tweets.json'
+        path.write_bytes(b'\n'.join(lines) + b'\n')
+        path = str(path)
+    else:
+        path = write_zip(tmp_path / 'tweets.json.zip', lines)
+    # Bloques chicos para que el modo paralelo reparta varios bloques/rangos
+    monkeypatch.setattr(q1_memory_module, 'BLOCK_SIZE', 4096)
+    monkeypatch.setattr(q1_memory_module.read_blocks, '__defaults__', (4096,))
+
+    assert q1_memory(path, workers=1) == q1_memory(path, workers=3)
+
+@pytest.mark.parametrize('workers', [1, 2])
+def test_ties_break_by_date_then_username(tmp_path, workers):
+    lines = []
+    # Tres fechas empatadas en total; dentro de cada una, usuarios empatados
+    for day in (3, 1, 2):
+        for username in ('zoe', 'ana', 'mia'):
+            lines.append(tweet_line(f'2021-02-{day:02d}T10:00:00+00:00', username))
+    lines.append(tweet_line('2021-02-09T10:00:00+00:00', 'solo'))
+    path = write_zip(tmp_path / 'tweets.json.zip', lines)
+
+    assert q1_memory(path, workers=workers) == [
+        (date(2021, 2, 1), 'ana'),
+        (date(2021, 2, 2), 'ana'),
+        (date(2021, 2, 3), 'ana'),
+        (date(2021, 2, 9), 'solo'),
+    ]
+
+def test_username_is_not_taken_from_nested_objects(tmp_path):
+    path = write_zip(tmp_path / 'tweets.json.zip', [
+        tweet_line('2021-02-01T10:00:00+00:00', 'bo'),
+        orjson.dumps({
+            'date': '2021-02-02T10:00:00+00:00',
+            'user': {'displayname': 'A'},
+            'quotedTweet': {'user': {'username': 'nested'}},
+        }),
+    ])
+
+    assert q1_memory(path) == [(date(2021, 2, 1), 'bo')]
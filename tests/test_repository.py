@@ -0,0 +1,61 @@
+import copy
+import pickle
+import zipfile
+from datetime import datetime, timezone
+
+import pytest
+
+from src.repository.memory_repository import MemoryOptimizedRepository
+from src.repository.models import Tweet, TweetColumns
+from src.repository.time_repository import TimeOptimizedRepository
+
+LINES = [
+    b'{"date": "2021-02-24T09:23:35+00:00", "user": {"username": "ana"}, "content": "hola @beto"}',
+    b'{"date": null, "user": {"username": "beto"}, "content": "sin fecha"}',
+    b'{"date": "2021-02-24T10:00:00+00:00", "user": {"username": "beto"}, "content": "chao"}',
+    b'no es json',
+    b'{"date": "2021-02-25T11:00:00+00:00", "user": {"username": "ana"}, "content": "otro"}',
+]
+
+@pytest.fixture
+def zip_path(tmp_path):
+    path = tmp_path / 'tweets.json.zip'
+    with zipfile.ZipFile(path, 'w', zipfile.ZIP_DEFLATED) as zip_file:
+        zip_file.writestr('tweets.json', b'\n'.join(LINES) + b'\n')
+    return str(path)
+
+@pytest.mark.parametrize('repository_class', [MemoryOptimizedRepository, TimeOptimizedRepository])
+@pytest.mark.parametrize('workers', [1, 3])
+def test_invalid_lines_are_skipped(zip_path, repository_class, workers):
+    with repository_class(zip_path, workers=workers) as repository:
+        tweets = list(repository.get_tweets())
+
+    assert [tweet.username for tweet in tweets] == ['ana', 'beto', 'ana']
+    assert tweets[0].mentions == ('beto',)
+
+def test_time_repository_parses_dates_like_the_parallel_path(tmp_path):
+    path = tmp_path / 'tweets.json'
+    path.write_bytes(
+        b'{"date": "2021-02-01T10:00:00", "user": {"username": "ana"}, "content": "naive"}\n'
+        b'{"date": "2021-02-01T22:00:00-03:00", "user": {"username": "ana"}, "content": "offset"}\n'
+    )
+
+    sequential = list(TimeOptimizedRepository(str(path)).get_tweets())
+    parallel = list(TimeOptimizedRepository(str(path), workers=2).get_tweets())
+
+    assert sequential == parallel
+    assert sequential[0].created_at.tzinfo is None
+    assert sequential[1].created_at.date().day == 1
+
+@pytest.mark.parametrize('clone', [
+    lambda value: pickle.loads(pickle.dumps(value)),
+    copy.copy,
+    copy.deepcopy,
+])
+def test_models_support_pickle_and_copy(clone):
+    created_at = datetime(2021, 2, 24, 9, 23, 35, tzinfo=timezone.utc)
+    tweet = Tweet(created_at, 'ana', 'hola @beto')
+    columns = TweetColumns([created_at], ['ana'], ['hola @beto'])
+
+    assert clone(tweet) == tweet
+    assert list(clone(columns)) == [tweet]
@@ -11,6 +11,7 @@ setup(
         "memory-profiler",
         "emoji",
         "ijson",
+        "orjson",
     ],
     python_requires=">=3.8",
     author="Juan Pablo Godoy",